@@ -189,7 +189,6 @@ def vpxPatches(progress_cb=None):
 
 def loadGamepadTestWindow():
     """Open a test webview window for gamepad diagnostics."""
-    webview_windows = []
     api = API(iniconfig)
     html = Path(__file__).parent / "web/diag/gamepad.html"
 
@@ -201,11 +200,7 @@ def loadGamepadTestWindow():
         fullscreen=True
     )
 
-    api.myWindow.append(win)
-    webview_windows.append(['table', win, api])
-    api.webview_windows = webview_windows
-    api.iniConfig = iniconfig
-    api._finish_setup()
+    api.attach_window('table', win)
 
 
 def gamepadtest():
@@ -6,7 +6,7 @@ class IniConfig:
 	def __init__(self, configfilepath):
 		
 		self.defaults = {
-			'Displays': {'bgscreenid': '', 'dmdscreenid': '', 'tablescreenid': '0' },
+			'Displays': {'bgscreenid': '', 'dmdscreenid': '', 'tablescreenid': '0', 'dmd_crop': '' },
 			'Settings': {
 				'vpxbinpath': '',
 				'tablerootdir': '',
@@ -50,6 +50,11 @@ class IniConfig:
 				'score_server_port': '3131',
 				'send_mode': 'automatic',
 				'notificationscreenid': '0',
+				'screenshot_format': 'jpeg',
+				'screenshot_max_edge': '1280',
+				'score_coalesce_ms': '100',
+				'batch_window_ms': '5000',
+				'max_batch': '10',
 				},
 		}
 
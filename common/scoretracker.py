@@ -9,29 +9,189 @@ Handles:
 """
 
 import threading
+import collections
 import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import logging.handlers
+import atexit
+import sys
 import io
+import tempfile
 import time
-import requests
+import traceback
+import uuid
 import platform
-from datetime import datetime
-from PIL import ImageGrab
-from screeninfo import get_monitors
-from pynput import keyboard
+from datetime import datetime, timezone
 
-logger = logging.getLogger(__name__)
+import websocket
 
+# requests, PIL, mss and pynput are imported where they are used, so a
+# disabled leaderboard never loads them. The log writer thread and the
+# connection warm-up pool are likewise only created by start() when enabled.
 
-def _ts():
-    """Return a timestamp string matching VPX log format: 2026-02-10 18:58:43.893"""
-    now = datetime.now()
-    return now.strftime('%Y-%m-%d %H:%M:%S.') + f'{now.microsecond // 1000:03d}'
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
+logger = logging.getLogger(__name__)
 
-def _log(level, msg):
-    """Print a log line with VPX-style timestamp."""
-    print(f"{_ts()} {level}  [ScoreTracker] {msg}")
+# Sessions left behind when a game never sends game_end (crash, table switch)
+MAX_GAME_SESSIONS = 8
+GAME_SESSION_TTL = 3600  # seconds
+
+# ROMs remembered for game_end debouncing, least recently ended dropped first
+MAX_GAME_END_DEBOUNCE = 64
+
+# Seconds of API inactivity after which a submission pre-opens the connection
+HTTP_PREWARM_IDLE = 30
+# The warm-up HEAD is never retried, and a POST waits at most this long for it
+HTTP_PREWARM_TIMEOUT = 2
+
+# Multipart bodies up to this size stay in memory, larger ones spill to disk
+SPOOL_MAX_SIZE = 4 * 1024 * 1024
+
+# Pending submissions allowed before new requests are dropped
+SUBMIT_QUEUE_SIZE = 4
+
+# Queued submission: wait delay seconds, then submit. score is the last_score
+# dict the request was made for (automatic mode) or None to submit whatever is current.
+SubmitReq = collections.namedtuple('SubmitReq', 'delay score')
+
+# Messages that (re)start a game session
+_START_TYPES = frozenset({'table_loaded', 'game_start'})
+
+# Strips thousands separators from displayed scores ("1,234.567" -> "1234567")
+_DIGIT_STRIP = str.maketrans('', '', ',.')
+
+# Leaderboard screenshot_format -> (Pillow format, save kwargs, filename, mimetype)
+SCREENSHOT_FORMATS = {
+    'jpeg': ('JPEG', {'quality': 85, 'optimize': False, 'progressive': False}, 'screenshot.jpg', 'image/jpeg'),
+    # compress_level 1 encodes several times faster than the default 6 for a modest size increase
+    'png': ('PNG', {'compress_level': 1, 'optimize': False}, 'screenshot.png', 'image/png'),
+    'webp': ('WEBP', {'quality': 85, 'method': 0}, 'screenshot.webp', 'image/webp'),
+}
+
+
+def _parse_score(p_data):
+    """Return a player's score from a score-server player dict as an int (0 if unparsable)."""
+    try:
+        raw_score = p_data.get('score', 0)
+        if type(raw_score) is int:
+            return raw_score
+        digits = str(raw_score).translate(_DIGIT_STRIP)
+        return int(digits) if digits else 0
+    except (AttributeError, ValueError, TypeError):
+        return 0
+
+
+# [Leaderboard] values used when the section is missing or disabled, and as
+# the fallback for integer keys that do not parse
+_LEADERBOARD_DEFAULTS = {
+    'enabled': False,
+    'api_url': '',
+    'api_key': '',
+    'machine_id': '',
+    'score_server_host': 'localhost',
+    'score_server_port': '3131',
+    'send_mode': 'manual',
+    'screenshot_format': 'jpeg',
+    'screenshot_max_edge': 1280,
+    'score_coalesce_ms': 100,
+    'batch_window_ms': 5000,
+    'max_batch': 10,
+}
+
+
+def _ini_int(config, key, minimum=0):
+    """
+    Read an integer [Leaderboard] key, falling back to its default on bad values.
+
+    The manager UI writes every key back from a free-text field, so empty or
+    non-numeric values must not stop VPinFE from starting.
+    """
+    default = _LEADERBOARD_DEFAULTS[key]
+    raw = config.get('Leaderboard', key, fallback=None)
+    if raw is None:
+        return default
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        logger.warning("Invalid [Leaderboard] %s value %r, using %s", key, raw, default)
+        return default
+    if value < minimum:
+        logger.warning("[Leaderboard] %s must be at least %s (got %s), using %s", key, minimum, value, default)
+        return default
+    return value
+
+
+def _iso_to_epoch(timestamp):
+    """Convert a score-server ISO timestamp (e.g. "2026-02-11T08:43:44.982Z") to epoch seconds."""
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1]
+    msg_time = datetime.fromisoformat(timestamp)
+    if msg_time.tzinfo is None:
+        msg_time = msg_time.replace(tzinfo=timezone.utc)
+    return msg_time.timestamp()
+
+
+class _SpooledBody(tempfile.SpooledTemporaryFile):
+    """
+    SpooledTemporaryFile that only goes to disk once it outgrows max_size.
+
+    Pillow and requests both probe fileno(), which would make a plain
+    SpooledTemporaryFile roll over immediately, so no descriptor is
+    reported while the data is still in memory.
+    """
+
+    def fileno(self):
+        if not self._rolled:
+            raise io.UnsupportedOperation("in-memory spool has no fileno")
+        return super().fileno()
+
+
+_log_listener = None
+_stdout_handler = None
+
+
+def _setup_logging(level_name):
+    """
+    Set this module's log level and write its lines straight to stdout.
+
+    Records below level_name are dropped before their %-args are formatted.
+    _start_log_listener moves the writing onto a thread once tracking starts.
+    """
+    global _stdout_handler
+    level = logging.getLevelName(level_name.strip().upper())
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+
+    if _stdout_handler is None:
+        # VPX log format: 2026-02-10 18:58:43.893 INFO  [ScoreTracker] message
+        _stdout_handler = logging.StreamHandler(sys.stdout)
+        _stdout_handler.setFormatter(logging.Formatter(
+            '%(asctime)s.%(msecs)03d %(levelname)s  [ScoreTracker] %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+        ))
+        logger.addHandler(_stdout_handler)
+        logger.propagate = False
+
+
+def _start_log_listener():
+    """
+    Route log lines through a queue to a stdout writer thread, so the
+    WebSocket/hotkey/submit threads never block on console I/O.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.removeHandler(_stdout_handler)
+    _log_listener = logging.handlers.QueueListener(log_queue, _stdout_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # flush queued lines on exit
 
 
 class ScoreTracker:
@@ -46,6 +206,7 @@ class ScoreTracker:
             on_notification: Callback function(title, message) for notifications
         """
         self.ini_config = ini_config
+        _setup_logging(ini_config.config.get('Logger', 'level', fallback='info'))
         self.on_notification = on_notification or (lambda t, m: None)
 
         # WebSocket state
@@ -53,78 +214,221 @@ class ScoreTracker:
         self.ws_thread = None
         self.running = False
 
-        # Game session tracking
-        self.game_session_data = {}
+        # Game session tracking, bounded LRU of rom_name -> {player_id: data}
+        self.game_session_data = collections.OrderedDict()
+        self._rom_ts = {}  # rom_name -> wall clock time of last session update
         self.last_score = {
             'rom_name': None,
             'score': None,
             'timestamp': None
         }
 
+        # Submission worker: one thread runs every submission, in order.
+        # Items are SubmitReq; None stops it. Bounded so stalled uploads apply backpressure.
+        self._submit_q = queue.Queue(maxsize=SUBMIT_QUEUE_SIZE)
+        self._submit_thread = None
+
         # Hotkey listener
         self.hotkey_thread = None
         self.hotkey_listener = None
 
         # Debounce: track last processed game_end per ROM to prevent duplicates
-        self._last_game_end = {}  # rom_name -> timestamp
+        # Only the WebSocket thread writes it, so plain dict ops are enough
+        self._last_game_end = collections.OrderedDict()  # rom_name -> time.monotonic()
 
         # Connection timestamp: ignore messages older than when we connected
-        self._ws_connected_at = None  # datetime (UTC)
+        self._ws_connected_at_epoch = None  # time.time() at connect
+        self._ws_connected_at_str = ''  # same instant, formatted for log lines
+
+        # Leaderboard config snapshot; rebuilt by reload_config()
+        self._cfg = None
+        self._enabled = False
+        self._send_mode = 'manual'
+        self._score_coalesce_s = 0.1
+        self._endpoint = None
+        self._batch_endpoint = None
+        self._base_form = {}
+        self.reload_config()
+
+        # current_scores coalescing: skip frames arriving faster than the window
+        # unless the ball changed; the newest skipped payload is kept pending
+        self._last_score_ts = 0.0
+        self._last_ball = None
+        self._pending_scores = None  # (rom_name, data)
+        self._last_scores_hash = {}  # rom_name -> hash of the last stored payload
+
+        # Screen grabber and HTTP session; set up in start(). mss instances are
+        # not thread-safe, so each capturing thread gets its own (see _get_sct).
+        self._mss = None  # mss module, or None to use PIL.ImageGrab
+        self._sct_local = threading.local()
+        self._http = None
+        self._http_last_used = 0.0  # monotonic time of the last API request
+
+        # Opens the API connection while a screenshot is still being encoded
+        self._prewarm_pool = None  # ThreadPoolExecutor, created in start()
+
+        # Monitor layout and capture screen ids, resolved on the first capture
+        # and again after the score server connection drops (see _on_ws_close)
+        self._monitors = None
+        self._dmd_screen_id = None
+        self._bg_screen_id = None
+        self._dmd_crop = None  # (x, y, w, h) relative to the DMD monitor
 
     def is_enabled(self):
         """Check if leaderboard tracking is enabled."""
-        if not self.ini_config.config.has_section('Leaderboard'):
-            return False
-        return self.ini_config.config.get('Leaderboard', 'enabled', fallback='0') == '1'
+        return self._enabled
 
     def get_config(self):
-        """Get leaderboard configuration."""
+        """Get leaderboard configuration (cached snapshot, see reload_config)."""
+        return self._cfg
+
+    def reload_config(self):
+        """Re-read the [Leaderboard] section into the cached config snapshot."""
+        self._cfg = self._build_config()
+        self._enabled = self._cfg['enabled']
+        self._send_mode = self._cfg['send_mode']
+        self._score_coalesce_s = self._cfg['score_coalesce_ms'] / 1000.0
+        api_url = self._cfg['api_url'].rstrip('/')
+        self._endpoint = api_url + '/api/submit-score-with-screenshot'
+        self._batch_endpoint = api_url + '/api/submit-scores-batch'
+        self._base_form = {'apiKey': self._cfg['api_key'], 'machineID': self._cfg['machine_id']}
+
+    def _build_config(self):
+        """Build the leaderboard configuration dict from the ini."""
         config = self.ini_config.config
         if not config.has_section('Leaderboard'):
-            return {
-                'enabled': False,
-                'api_url': '',
-                'api_key': '',
-                'machine_id': '',
-                'score_server_host': 'localhost',
-                'score_server_port': '3131',
-            }
+            return dict(_LEADERBOARD_DEFAULTS)
+        try:
+            enabled = config.getboolean('Leaderboard', 'enabled', fallback=False)
+        except ValueError:
+            logger.warning("Invalid [Leaderboard] enabled value, treating as disabled")
+            enabled = False
+        if not enabled:
+            # Nothing else is used while disabled, so a bad value can't break startup
+            return dict(_LEADERBOARD_DEFAULTS)
         return {
-            'enabled': config.get('Leaderboard', 'enabled', fallback='0') == '1',
+            'enabled': enabled,
             'api_url': config.get('Leaderboard', 'api_url', fallback=''),
             'api_key': config.get('Leaderboard', 'api_key', fallback=''),
             'machine_id': config.get('Leaderboard', 'machine_id', fallback=''),
             'score_server_host': config.get('Leaderboard', 'score_server_host', fallback='localhost'),
             'score_server_port': config.get('Leaderboard', 'score_server_port', fallback='3131'),
             'send_mode': config.get('Leaderboard', 'send_mode', fallback='manual').lower(),
+            'screenshot_format': config.get('Leaderboard', 'screenshot_format', fallback='jpeg').strip().lower(),
+            'screenshot_max_edge': _ini_int(config, 'screenshot_max_edge'),
+            'score_coalesce_ms': _ini_int(config, 'score_coalesce_ms'),
+            'batch_window_ms': _ini_int(config, 'batch_window_ms'),
+            'max_batch': _ini_int(config, 'max_batch', minimum=1),
         }
 
+    def _init_capture(self):
+        """Check for mss, falling back to PIL.ImageGrab without it."""
+        try:
+            import mss
+            self._mss = mss
+        except ImportError as e:
+            logger.warning("mss unavailable, falling back to ImageGrab: %s", e)
+            self._mss = None
+
+    def _get_sct(self):
+        """Return this thread's mss grabber, creating it on first use (None without mss)."""
+        sct = getattr(self._sct_local, 'sct', None)
+        if sct is None and self._mss is not None:
+            try:
+                sct = self._sct_local.sct = self._mss.mss()
+            except Exception as e:
+                logger.warning("mss failed to initialise, falling back to ImageGrab: %s", e)
+                self._mss = None
+        return sct
+
+    def _init_http(self):
+        """
+        Create the persistent HTTP session so submissions reuse the keep-alive
+        connection. urllib3 does not retry POST on status codes, only on
+        connection failure.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,  # a single API host
+            pool_maxsize=2,  # lets a POST proceed while a timed-out warm-up HEAD is still open
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+
+    def refresh_monitors(self):
+        """Re-enumerate monitors and re-read the [Displays] screen ids."""
+        from screeninfo import get_monitors
+
+        try:
+            self._monitors = get_monitors()
+        except Exception as e:
+            logger.error("Monitor enumeration failed: %s", e)
+            self._monitors = []
+
+        config = self.ini_config.config
+        dmdscreenid = config.get('Displays', 'dmdscreenid', fallback='').strip()
+        bgscreenid = config.get('Displays', 'bgscreenid', fallback='').strip()
+        try:
+            self._dmd_screen_id = int(dmdscreenid) if dmdscreenid else None
+            self._bg_screen_id = int(bgscreenid) if bgscreenid else None
+        except ValueError as e:
+            logger.error("Invalid screen id in [Displays]: %s", e)
+            self._dmd_screen_id = None
+            self._bg_screen_id = None
+
+        dmd_crop = config.get('Displays', 'dmd_crop', fallback='').strip()
+        self._dmd_crop = None
+        if dmd_crop:
+            try:
+                x, y, w, h = (int(v) for v in dmd_crop.split(','))
+                if w <= 0 or h <= 0:
+                    raise ValueError("width and height must be positive")
+                self._dmd_crop = (x, y, w, h)
+            except ValueError as e:
+                logger.error("Invalid dmd_crop '%s' (expected x,y,w,h): %s", dmd_crop, e)
+
     def start(self):
         """Start the score tracker (WebSocket + hotkey listener)."""
-        _log("INFO", "ScoreTracker.start() called")
+        logger.info("ScoreTracker.start() called")
+
+        self.reload_config()
 
         if not self.is_enabled():
-            _log("INFO", "Leaderboard tracking is disabled")
+            logger.info("Leaderboard tracking is disabled")
             return
 
-        _log("INFO", "Leaderboard tracking is ENABLED")
+        logger.info("Leaderboard tracking is ENABLED")
 
+        _start_log_listener()
         self.running = True
 
+        self._init_capture()
+        self._init_http()
+        if self._prewarm_pool is None:
+            self._prewarm_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='score-prewarm')
+
+        # Start submission worker
+        self._submit_thread = threading.Thread(target=self._run_submit_worker, daemon=True)
+        self._submit_thread.start()
+
         # Start WebSocket connection
         self.ws_thread = threading.Thread(target=self._run_websocket, daemon=True)
         self.ws_thread.start()
 
         # Start hotkey listener only if in manual mode
-        config = self.get_config()
-        if config['send_mode'] == 'manual':
-            _log("INFO", "Starting hotkey listener (manual mode)")
+        if self._send_mode == 'manual':
+            logger.info("Starting hotkey listener (manual mode)")
             self.hotkey_thread = threading.Thread(target=self._run_hotkey_listener, daemon=True)
             self.hotkey_thread.start()
         else:
-            _log("INFO", "Automatic mode enabled: Hotkey listener skipped")
+            logger.info("%s mode enabled: Hotkey listener skipped", self._send_mode.capitalize())
 
-        _log("INFO", "ScoreTracker started")
+        logger.info("ScoreTracker started")
 
     def stop(self):
         """Stop the score tracker."""
@@ -142,18 +446,25 @@ class ScoreTracker:
             except:
                 pass
 
-        _log("INFO", "ScoreTracker stopped")
+        try:
+            self._submit_q.put_nowait(None)
+        except queue.Full:
+            pass  # Worker exits on the running flag after its current item
+        if self._prewarm_pool:
+            self._prewarm_pool.shutdown(wait=False)
+        if self._http:
+            self._http.close()
+
+        logger.info("ScoreTracker stopped")
 
     def _run_websocket(self):
         """Run WebSocket connection in background thread."""
-        import websocket
-
         config = self.get_config()
         url = f"ws://{config['score_server_host']}:{config['score_server_port']}"
 
         while self.running:
             try:
-                _log("INFO", f"Connecting to score server at {url}...")
+                logger.info("Connecting to score server at %s...", url)
                 self.ws = websocket.WebSocketApp(
                     url,
                     on_open=self._on_ws_open,
@@ -164,34 +475,36 @@ class ScoreTracker:
                 self.ws.run_forever()
 
                 if self.running:
-                    _log("WARN", "WebSocket connection closed. Reconnecting in 10 seconds...")
+                    logger.warning("WebSocket connection closed. Reconnecting in 10 seconds...")
                     time.sleep(10)
             except Exception as e:
-                _log("ERROR", f"WebSocket error: {e}")
+                logger.error("WebSocket error: %s", e)
                 if self.running:
                     time.sleep(10)
 
     def _on_ws_open(self, ws):
         """Handle WebSocket connection opened."""
-        self._ws_connected_at = datetime.utcnow()
-        _log("INFO", f"WebSocket connected (will ignore messages timestamped before {self._ws_connected_at.strftime('%Y-%m-%dT%H:%M:%S')}Z)")
+        self._ws_connected_at_epoch = time.time()
+        self._ws_connected_at_str = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(self._ws_connected_at_epoch))
+        logger.info("WebSocket connected (will ignore messages timestamped before %sZ)", self._ws_connected_at_str)
 
     def _on_ws_message(self, ws, message):
         """Handle incoming WebSocket messages."""
         try:
-            data = json.loads(message)
-        except:
+            data = _json.loads(message)
+        except (ValueError, TypeError):
+            return  # Not JSON (orjson/json decode errors are ValueErrors)
+        if not isinstance(data, dict):
             return
 
         # Ignore stale messages that were queued before we connected
         msg_timestamp = data.get('timestamp', '')
-        if msg_timestamp and self._ws_connected_at:
+        if msg_timestamp and self._ws_connected_at_epoch:
             try:
-                # Parse ISO timestamp from score-server (e.g. "2026-02-11T08:43:44.982Z")
-                msg_time = datetime.strptime(msg_timestamp.replace('Z', ''), '%Y-%m-%dT%H:%M:%S.%f')
-                if msg_time < self._ws_connected_at:
+                if _iso_to_epoch(msg_timestamp) < self._ws_connected_at_epoch:
                     msg_type = data.get('type', '')
-                    _log("INFO", f"Ignoring stale {msg_type} message (timestamp={msg_timestamp}, connected at {self._ws_connected_at.strftime('%Y-%m-%dT%H:%M:%S')}Z)")
+                    logger.info("Ignoring stale %s message (timestamp=%s, connected at %sZ)",
+                         msg_type, msg_timestamp, self._ws_connected_at_str)
                     return
             except ValueError:
                 pass  # If timestamp parsing fails, process the message normally
@@ -199,31 +512,38 @@ class ScoreTracker:
         rom_name = data.get('rom', 'unknown_rom')
         msg_type = data.get('type', '')
 
-        if msg_type in ['table_loaded', 'game_start']:
-            self.game_session_data[rom_name] = {}
+        if msg_type in _START_TYPES:
+            self._expire_sessions(keep=rom_name)
+            self._session(rom_name).clear()
+            self._last_scores_hash.pop(rom_name, None)
+            self._pending_scores = None
             # Clear debounce on new game start so next game_end is accepted
             self._last_game_end.pop(rom_name, None)
-            _log("INFO", f"Game started: {rom_name}")
+            logger.info("Game started: %s", rom_name)
             return
 
         if msg_type == 'game_end':
             reason = data.get('reason', '')
+            self._flush_pending_scores()
 
             # Ignore plugin_unload events — the game was already ended properly
             if reason == 'plugin_unload':
-                _log("INFO", f"Ignoring game_end (plugin_unload) for: {rom_name}")
-                self.game_session_data.pop(rom_name, None)
+                logger.info("Ignoring game_end (plugin_unload) for: %s", rom_name)
+                self._drop_session(rom_name)
                 return
 
             # Debounce: ignore duplicate game_end for the same ROM within 10 seconds
-            now = time.time()
-            last = self._last_game_end.get(rom_name, 0)
-            if now - last < 10:
-                _log("WARN", f"Ignoring duplicate game_end for {rom_name} (received {now - last:.1f}s after previous)")
+            now = time.monotonic()
+            last = self._last_game_end.get(rom_name)
+            if last is not None and now - last < 10:
+                logger.warning("Ignoring duplicate game_end for %s (received %.1fs after previous)", rom_name, now - last)
                 return
             self._last_game_end[rom_name] = now
+            self._last_game_end.move_to_end(rom_name)
+            if len(self._last_game_end) > MAX_GAME_END_DEBOUNCE:
+                self._last_game_end.popitem(last=False)
 
-            _log("INFO", f"Game ended: {rom_name} (reason={reason})")
+            logger.info("Game ended: %s (reason=%s)", rom_name, reason)
 
             # Find the highest score from all players
             best_score = 0
@@ -231,28 +551,14 @@ class ScoreTracker:
             # Prefer scores from the game_end payload (sent by score-server)
             end_scores = data.get('scores', [])
             if end_scores:
-                _log("INFO", f"Using scores from game_end payload ({len(end_scores)} players)")
-                for p_data in end_scores:
-                    try:
-                        raw_score = p_data.get('score', 0)
-                        score = int(str(raw_score).replace(',', '').replace('.', '').lstrip('0') or 0)
-                        if score > best_score:
-                            best_score = score
-                    except:
-                        pass
+                logger.info("Using scores from game_end payload (%d players)", len(end_scores))
+                best_score = max((_parse_score(p) for p in end_scores), default=0)
             # Fallback: use accumulated session data (backward compatibility)
             elif rom_name in self.game_session_data and self.game_session_data[rom_name]:
-                _log("INFO", f"No scores in game_end payload, using accumulated session data")
-                for player_id, p_data in self.game_session_data[rom_name].items():
-                    try:
-                        raw_score = p_data.get('score', 0)
-                        score = int(str(raw_score).replace(',', '').replace('.', '').lstrip('0') or 0)
-                        if score > best_score:
-                            best_score = score
-                    except:
-                        pass
+                logger.info("No scores in game_end payload, using accumulated session data")
+                best_score = max((_parse_score(p) for p in self.game_session_data[rom_name].values()), default=0)
             else:
-                _log("WARN", f"game_end received for {rom_name} but no scores available (not in payload, not in session)")
+                logger.warning("game_end received for %s but no scores available (not in payload, not in session)", rom_name)
 
             if best_score > 0:
                 # Store as last score for screenshot submission
@@ -261,199 +567,536 @@ class ScoreTracker:
                     'score': best_score,
                     'timestamp': datetime.now()
                 }
-                _log("INFO", f"Last score updated: {rom_name} - {best_score:,}")
+                logger.info("Last score updated: %s - %s", rom_name, f"{best_score:,}")
 
                 # Check for automatic submission
-                config = self.get_config()
-                if config['send_mode'] == 'automatic':
-                    _log("INFO", "Automatic mode: Triggering submission in 2 seconds...")
-
-                    def auto_submit():
-                        # Small delay to ensure any end-game screen/animations settle
-                        time.sleep(2)
-                        self.submit_score_with_screenshot()
-
-                    threading.Thread(target=auto_submit, daemon=True).start()
+                if self._send_mode in ('automatic', 'batched'):
+                    logger.info("%s mode: Triggering submission in 2 seconds...", self._send_mode.capitalize())
+                    # Small delay to ensure any end-game screen/animations settle
+                    self._enqueue_submit(SubmitReq(delay=2.0, score=self.last_score))
 
             # Clean up session
-            self.game_session_data.pop(rom_name, None)
+            self._drop_session(rom_name)
             return
 
         if msg_type == 'current_scores':
-            if rom_name not in self.game_session_data:
-                self.game_session_data[rom_name] = {}
-
-            for p_data in data.get('scores', []):
-                try:
-                    p_label = str(p_data.get('player', ''))
-                    p_score = p_data.get('score', 0)
-                    p_id = p_label.replace("Player", "").strip() if "Player" in p_label else p_label
-
-                    self.game_session_data[rom_name][p_id] = {
-                        'score': p_score,
-                        'ball': data.get('current_ball')
-                    }
-                except Exception as e:
-                    _log("ERROR", f"Error parsing player data: {e}")
+            # Coalesce bursts: inside the window only the newest payload is kept
+            now = time.monotonic()
+            ball = data.get('current_ball')
+            if now - self._last_score_ts < self._score_coalesce_s and ball == self._last_ball:
+                self._pending_scores = (rom_name, data)
+                return
+            self._last_score_ts = now
+            self._last_ball = ball
+            self._pending_scores = None
+            self._store_current_scores(rom_name, data)
+
+    def _flush_pending_scores(self):
+        """Apply a current_scores payload that was held back by coalescing."""
+        if self._pending_scores:
+            rom_name, data = self._pending_scores
+            self._pending_scores = None
+            self._store_current_scores(rom_name, data)
+
+    def _store_current_scores(self, rom_name, data):
+        """Record per-player scores from a current_scores payload."""
+        session = self._session(rom_name)
+
+        # Ball-in-play updates often repeat the same scores; skip the rewrite
+        scores = data.get('scores', [])
+        try:
+            h = hash((data.get('current_ball'),
+                      tuple((p.get('player'), p.get('score')) for p in scores)))
+        except (AttributeError, TypeError):
+            h = None  # malformed or unhashable entries, let the loop below log them
+        if h is not None and h == self._last_scores_hash.get(rom_name):
+            return
+        self._last_scores_hash[rom_name] = h
+
+        for p_data in scores:
+            try:
+                p_label = str(p_data.get('player', ''))
+                p_score = p_data.get('score', 0)
+                p_id = p_label.replace("Player", "").strip() if "Player" in p_label else p_label
+
+                session[p_id] = {
+                    'score': p_score,
+                    'ball': data.get('current_ball')
+                }
+            except Exception as e:
+                logger.error("Error parsing player data: %s", e)
+
+    def _session(self, rom_name):
+        """Return the session dict for rom_name, creating it and marking it most recent."""
+        session = self.game_session_data.get(rom_name)
+        if session is None:
+            session = self.game_session_data[rom_name] = {}
+        else:
+            self.game_session_data.move_to_end(rom_name)
+        self._rom_ts[rom_name] = time.time()
+
+        while len(self.game_session_data) > MAX_GAME_SESSIONS:
+            old_rom, _ = self.game_session_data.popitem(last=False)
+            self._rom_ts.pop(old_rom, None)
+            self._last_scores_hash.pop(old_rom, None)
+        return session
+
+    def _drop_session(self, rom_name):
+        """Forget the session for rom_name."""
+        self.game_session_data.pop(rom_name, None)
+        self._rom_ts.pop(rom_name, None)
+        self._last_scores_hash.pop(rom_name, None)
+
+    def _expire_sessions(self, keep=None):
+        """Drop sessions (other than keep) that have not been updated within GAME_SESSION_TTL."""
+        cutoff = time.time() - GAME_SESSION_TTL
+        for rom in [r for r, ts in self._rom_ts.items() if ts < cutoff and r != keep]:
+            self._drop_session(rom)
 
     def _on_ws_error(self, ws, error):
         """Handle WebSocket errors."""
-        _log("ERROR", f"WebSocket error: {error}")
+        logger.error("WebSocket error: %s", error)
 
     def _on_ws_close(self, ws, close_status_code, close_msg):
         """Handle WebSocket close."""
-        _log("INFO", f"WebSocket connection closed. Reconnecting in 10 seconds...")
+        logger.info("WebSocket connection closed. Reconnecting in 10 seconds...")
+        # VPX restarting can change the display layout; re-scan on next capture
+        self._monitors = None
 
     def _run_hotkey_listener(self):
         """Run hotkey listener in background thread."""
+        from pynput import keyboard
+
         # Define the hotkey combination based on OS
         system = platform.system()
         if system == 'Darwin':  # macOS
-            COMBO = {keyboard.Key.cmd, keyboard.Key.shift, keyboard.KeyCode.from_char('s')}
+            hotkey = '<cmd>+<shift>+s'
             hotkey_label = "Cmd+Shift+S"
         else:  # Linux, Windows, and others
-            COMBO = {keyboard.Key.ctrl, keyboard.Key.shift, keyboard.KeyCode.from_char('s')}
+            hotkey = '<ctrl>+<shift>+s'
             hotkey_label = "Ctrl+Shift+S"
 
-        _log("INFO", f"Starting hotkey listener ({hotkey_label} for screenshot submission)...")
-        current_keys = set()
+        logger.info("Starting hotkey listener (%s for screenshot submission)...", hotkey_label)
 
-        def on_press(key):
-            current_keys.add(key)
-            if COMBO.issubset(current_keys):
-                self._on_screenshot_hotkey()
-
-        def on_release(key):
-            current_keys.discard(key)
-
-        self.hotkey_listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+        # GlobalHotKeys tracks the combo state itself and only calls back on a match
+        self.hotkey_listener = keyboard.GlobalHotKeys({hotkey: self._on_screenshot_hotkey})
         self.hotkey_listener.start()
         self.hotkey_listener.join()
 
     def _on_screenshot_hotkey(self):
         """Handle screenshot hotkey press."""
-        _log("INFO", "Screenshot hotkey triggered")
-        # Run submission in a separate thread to not block the hotkey listener
-        threading.Thread(target=self.submit_score_with_screenshot, daemon=True).start()
+        logger.info("Screenshot hotkey triggered")
+        # Hand off to the submission worker to not block the hotkey listener
+        self._enqueue_submit(SubmitReq(delay=0, score=None))
+
+    def _enqueue_submit(self, req):
+        """Queue a submission for the worker, dropping it if the queue is full."""
+        try:
+            self._submit_q.put_nowait(req)
+        except queue.Full:
+            logger.warning("Submission queue full, dropping request")
+
+    def _run_submit_worker(self):
+        """Run queued submissions one at a time in a background thread."""
+        while self.running:
+            req = self._submit_q.get()
+            if req is None:
+                break
+            # One failed submission must not take the worker down with it
+            try:
+                if not self._handle_submit_req(req):
+                    break
+            except Exception as e:
+                logger.error("Queued submission failed: %s", e)
+                traceback.print_exc()
+
+    def _handle_submit_req(self, req):
+        """
+        Process one queued submission request.
+
+        Returns:
+            False if the stop sentinel was received (batched mode), else True
+        """
+        if self._send_mode == 'batched':
+            return self._run_batch(req)
+        if req.delay:
+            time.sleep(req.delay)
+        # An automatic request is stale once its score was submitted or replaced
+        if req.score is not None and req.score is not self.last_score:
+            logger.info("Skipping queued submission for %s (score already handled)", req.score['rom_name'])
+            return True
+        self.submit_score_with_screenshot()
+        return True
+
+    def _run_batch(self, req):
+        """
+        Collect requests for up to batch_window_ms / max_batch and submit them together.
 
-    def submit_score_with_screenshot(self):
-        """Capture screenshot and submit score + screenshot to API."""
-        _log("INFO", f"submit_score_with_screenshot called, last_score={self.last_score}")
+        Each score is captured with its own screenshot as its request comes up.
 
-        if not self.last_score['rom_name']:
-            _log("WARN", "No score available to submit")
+        Returns:
+            False if the stop sentinel was received while collecting, else True
+        """
+        config = self.get_config()
+        deadline = time.monotonic() + config['batch_window_ms'] / 1000.0
+        items = []
+        keep_running = True
+
+        while True:
+            if req.delay:
+                time.sleep(req.delay)
+            score = req.score if req.score is not None else self.last_score
+            if score['rom_name']:
+                screenshot = self._take_screenshot()
+                if screenshot is not None:
+                    items.append((score, screenshot))
+            if len(items) >= config['max_batch']:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                req = self._submit_q.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if req is None:
+                keep_running = False
+                break
+
+        if len(items) == 1:
+            self.submit_score_with_screenshot(*items[0])
+        elif items:
+            self._submit_batch(items)
+        return keep_running
+
+    def _take_screenshot(self):
+        """Capture the leaderboard screenshot and downscale it; None (with a notification) on failure."""
+        logger.info("Capturing screenshot...")
+        screenshot = self._capture_screenshot()
+        if not screenshot:
+            logger.error("Screenshot capture returned None")
+            self.on_notification("Error", "Failed to capture screenshot")
+            return None
+
+        logger.info("Screenshot captured: %s", screenshot.size)
+
+        # Downscale so the long edge fits screenshot_max_edge; 0 disables
+        from PIL import Image
+        max_edge = self.get_config()['screenshot_max_edge']
+        scale = max_edge / max(screenshot.size) if max_edge > 0 else 1
+        if scale < 1:
+            new_size = (max(1, int(screenshot.width * scale)), max(1, int(screenshot.height * scale)))
+            screenshot = screenshot.resize(new_size, Image.Resampling.BILINEAR)
+            logger.info("Screenshot downscaled to %s", screenshot.size)
+        return screenshot
+
+    def _prewarm_http(self):
+        """
+        Warm up TCP/TLS in parallel with capture + encode unless the
+        keep-alive connection was used recently.
+
+        Returns:
+            Future to wait on before posting, or None
+        """
+        if (not self.running or self._prewarm_pool is None
+                or time.monotonic() - self._http_last_used <= HTTP_PREWARM_IDLE):
+            return None
+        try:
+            return self._prewarm_pool.submit(self._prewarm_head, self.get_config()['api_url'])
+        except RuntimeError:
+            return None  # stop() shut the pool down while this submission was waiting
+
+    def _prewarm_head(self, url):
+        """
+        Send the warm-up HEAD without the adapter's retries: on an unreachable
+        host the warm-up should fail fast, not add its own backoff.
+
+        The pool is looked up the way HTTPAdapter.send does it (TLS settings
+        are part of the pool key since requests 2.32), so the connection left
+        open is the one the following POST picks up.
+        """
+        import requests
+
+        session = self._http
+        request = session.prepare_request(requests.Request('HEAD', url))
+        settings = session.merge_environment_settings(request.url, {}, None, None, None)
+        verify, proxies, cert = settings['verify'], settings['proxies'], settings['cert']
+        adapter = session.get_adapter(request.url)
+        if hasattr(adapter, 'get_connection_with_tls_context'):
+            conn = adapter.get_connection_with_tls_context(request, verify, proxies, cert)
+        else:  # requests < 2.32
+            conn = adapter.get_connection(request.url, proxies)
+        adapter.cert_verify(conn, request.url, verify, cert)
+        conn.urlopen(
+            'HEAD', adapter.request_url(request, proxies),
+            headers=request.headers, redirect=False, assert_same_host=False,
+            retries=False, timeout=HTTP_PREWARM_TIMEOUT,
+        )
+
+    def _post(self, endpoint, body, content_type, prewarm):
+        """POST a multipart body once any connection warm-up has finished."""
+        if prewarm is not None:
+            try:
+                prewarm.result(timeout=HTTP_PREWARM_TIMEOUT)
+            except Exception:
+                pass  # Only a warm-up; the POST reports real errors
+
+        response = self._http.post(endpoint, data=body, headers={'Content-Type': content_type}, timeout=30)
+        self._http_last_used = time.monotonic()
+        return response
+
+    def submit_score_with_screenshot(self, score=None, screenshot=None):
+        """
+        Capture screenshot and submit score + screenshot to API.
+
+        Args:
+            score: last_score-style dict to submit; defaults to self.last_score
+            screenshot: already captured image; captured now if None
+        """
+        import requests
+
+        if score is None:
+            score = self.last_score
+        logger.info("submit_score_with_screenshot called, score=%s", score)
+
+        if not score['rom_name']:
+            logger.warning("No score available to submit")
             self.on_notification("Error", "No score available!\nPlay a game first.")
             return
 
         config = self.get_config()
 
         if not config['api_url'] or not config['api_key']:
-            _log("ERROR", "API URL or API Key not configured")
+            logger.error("API URL or API Key not configured")
             self.on_notification("Error", "Leaderboard not configured!")
             return
 
         try:
+            prewarm = self._prewarm_http()
             # Capture screenshot from appropriate screen
-            _log("INFO", "Capturing screenshot...")
-            screenshot = self._capture_screenshot()
-            if not screenshot:
-                _log("ERROR", "Screenshot capture returned None")
-                self.on_notification("Error", "Failed to capture screenshot")
-                return
-
-            _log("INFO", f"Screenshot captured: {screenshot.size}")
-
-            # Convert to bytes
-            buffer = io.BytesIO()
-            screenshot.save(buffer, format='PNG')
-            buffer.seek(0)
+            if screenshot is None:
+                screenshot = self._take_screenshot()
+                if screenshot is None:
+                    return
 
-            # Prepare multipart form data
-            files = {
-                'screenshot': ('screenshot.png', buffer, 'image/png')
-            }
+            # Encode the image straight into the multipart request body
             data = {
-                'apiKey': config['api_key'],
-                'machineID': config['machine_id'],
-                'romName': self.last_score['rom_name'],
-                'score': str(self.last_score['score']),
+                **self._base_form,
+                'romName': score['rom_name'],
+                'score': str(score['score']),
             }
+            body, content_type = self._encode_multipart(data, [('screenshot', screenshot)], config['screenshot_format'])
 
             # Submit to API
-            api_url = config['api_url'].rstrip('/')
-            endpoint = f"{api_url}/api/submit-score-with-screenshot"
+            endpoint = self._endpoint
 
-            _log("INFO", f"Submitting score to {endpoint} - romName={data['romName']}, score={data['score']}")
+            logger.info("Submitting score to %s - romName=%s, score=%s", endpoint, data['romName'], data['score'])
 
-            response = requests.post(endpoint, files=files, data=data, timeout=30)
+            with body:
+                response = self._post(endpoint, body, content_type, prewarm)
             response.raise_for_status()
 
             result = response.json()
-            _log("INFO", f"Response: status={response.status_code}, result={result}")
+            logger.info("Response: status=%s, result=%s", response.status_code, result)
 
             if result.get('success'):
-                score_formatted = f"{self.last_score['score']:,}"
-                table_name = result.get('tableName', self.last_score['rom_name'])
-                _log("INFO", f"Score submitted successfully: {table_name} - {score_formatted}")
+                score_formatted = f"{score['score']:,}"
+                table_name = result.get('tableName', score['rom_name'])
+                logger.info("Score submitted successfully: %s - %s", table_name, score_formatted)
                 self.on_notification(
                     "Score Submitted!",
                     f"Table: {table_name}\nScore: {score_formatted}"
                 )
                 # Clear last score after successful submission
-                self.last_score = {'rom_name': None, 'score': None, 'timestamp': None}
+                if score is self.last_score:
+                    self.last_score = {'rom_name': None, 'score': None, 'timestamp': None}
             else:
                 raise Exception(result.get('error', 'Unknown error'))
 
         except requests.exceptions.RequestException as e:
-            _log("ERROR", f"API request failed: {e}")
+            logger.error("API request failed: %s", e)
             self.on_notification("Error", f"Failed to submit:\n{str(e)[:50]}")
         except Exception as e:
-            _log("ERROR", f"Screenshot submission failed: {e}")
-            import traceback
+            logger.error("Screenshot submission failed: %s", e)
             traceback.print_exc()
             self.on_notification("Error", f"Submission failed:\n{str(e)[:50]}")
 
+    def _submit_batch(self, items):
+        """
+        Submit several scores and their screenshots in one request.
+
+        Falls back to one request per score if the API has no batch endpoint.
+
+        Args:
+            items: list of (score dict, screenshot) tuples
+        """
+        import requests
+
+        config = self.get_config()
+
+        if not config['api_url'] or not config['api_key']:
+            logger.error("API URL or API Key not configured")
+            self.on_notification("Error", "Leaderboard not configured!")
+            return
+
+        try:
+            prewarm = self._prewarm_http()
+            data = {
+                **self._base_form,
+                'scores': json.dumps([
+                    {'romName': score['rom_name'], 'score': str(score['score'])}
+                    for score, _ in items
+                ]),
+            }
+            screenshots = [(f'screenshot_{i}', screenshot) for i, (_, screenshot) in enumerate(items)]
+            body, content_type = self._encode_multipart(data, screenshots, config['screenshot_format'])
+
+            logger.info("Submitting batch of %s scores to %s", len(items), self._batch_endpoint)
+
+            with body:
+                response = self._post(self._batch_endpoint, body, content_type, prewarm)
+            if response.status_code == 404:
+                logger.warning("Batch endpoint not available, submitting scores one by one")
+                for score, screenshot in items:
+                    self.submit_score_with_screenshot(score, screenshot)
+                return
+            response.raise_for_status()
+
+            result = response.json()
+            logger.info("Response: status=%s, result=%s", response.status_code, result)
+
+            if result.get('success'):
+                logger.info("Batch of %s scores submitted successfully", len(items))
+                self.on_notification(
+                    "Scores Submitted!",
+                    "\n".join(f"{score['rom_name']}: {score['score']:,}" for score, _ in items)
+                )
+                if any(score is self.last_score for score, _ in items):
+                    self.last_score = {'rom_name': None, 'score': None, 'timestamp': None}
+            else:
+                raise Exception(result.get('error', 'Unknown error'))
+
+        except requests.exceptions.RequestException as e:
+            logger.error("API batch request failed: %s", e)
+            self.on_notification("Error", f"Failed to submit:\n{str(e)[:50]}")
+        except Exception as e:
+            logger.error("Batch submission failed: %s", e)
+            traceback.print_exc()
+            self.on_notification("Error", f"Submission failed:\n{str(e)[:50]}")
+
+    def _encode_multipart(self, fields, screenshots, fmt):
+        """
+        Build a multipart/form-data body with the screenshots encoded in place.
+
+        The images are saved directly into the request body, which is handed
+        to requests as a file object so it is streamed rather than copied into
+        a second in-memory body. Bodies over SPOOL_MAX_SIZE spill to a temp file.
+
+        Args:
+            fields: dict of plain form fields
+            screenshots: list of (form field name, image) tuples
+            fmt: screenshot_format key
+
+        Returns:
+            (body file object positioned at 0, Content-Type header value)
+        """
+        if fmt not in SCREENSHOT_FORMATS:
+            logger.warning("Unknown screenshot_format '%s', using jpeg", fmt)
+            fmt = 'jpeg'
+        pil_format, save_kwargs, filename, mimetype = SCREENSHOT_FORMATS[fmt]
+
+        boundary = uuid.uuid4().hex
+        body = _SpooledBody(max_size=SPOOL_MAX_SIZE)
+        for name, value in fields.items():
+            body.write(
+                f'--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f'{value}\r\n'.encode('utf-8')
+            )
+        for name, screenshot in screenshots:
+            # ImageGrab can hand back RGBA (e.g. on macOS), which JPEG cannot store
+            if pil_format == 'JPEG' and screenshot.mode != 'RGB':
+                screenshot = screenshot.convert('RGB')
+            body.write(
+                f'--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                f'Content-Type: {mimetype}\r\n\r\n'.encode('utf-8')
+            )
+            screenshot.save(body, format=pil_format, **save_kwargs)
+            body.write(b'\r\n')
+        body.write(f'--{boundary}--\r\n'.encode('utf-8'))
+        body.seek(0)
+        return body, f'multipart/form-data; boundary={boundary}'
+
+    def _grab(self, region=None):
+        """
+        Grab a screen region as an RGB PIL image.
+
+        Args:
+            region: (left, top, width, height) in virtual desktop pixels,
+                    or None for the primary screen
+        """
+        from PIL import Image, ImageGrab
+
+        sct = self._get_sct()
+        if sct is None:
+            if region is None:
+                return ImageGrab.grab()
+            left, top, width, height = region
+            return ImageGrab.grab(bbox=(left, top, left + width, top + height))
+
+        if region is None:
+            sct_region = sct.monitors[1]
+        else:
+            left, top, width, height = region
+            sct_region = {'left': left, 'top': top, 'width': width, 'height': height}
+        sct_img = sct.grab(sct_region)
+        # Decode BGRA straight into RGB in one pass (no sct_img.rgb copy, and
+        # the JPEG encoder then skips its convert('RGB'))
+        return Image.frombuffer('RGB', sct_img.size, sct_img.bgra, 'raw', 'BGRX', 0, 1)
+
     def _capture_screenshot(self):
         """
         Capture screenshot from the appropriate screen.
 
         Priority:
-        1. If dmdscreenid is set, capture that screen
+        1. If dmdscreenid is set, capture that screen (or its dmd_crop area)
         2. Else if bgscreenid is set, capture that screen
         3. Else capture primary screen
         """
         try:
-            monitors = get_monitors()
-            config = self.ini_config.config
-
-            # Determine which screen to capture
-            screen_id = None
-
-            dmdscreenid = config.get('Displays', 'dmdscreenid', fallback='').strip()
-            bgscreenid = config.get('Displays', 'bgscreenid', fallback='').strip()
-
-            if dmdscreenid:
-                screen_id = int(dmdscreenid)
-                _log("INFO", f"Capturing DMD screen (id={screen_id})")
-            elif bgscreenid:
-                screen_id = int(bgscreenid)
-                _log("INFO", f"Capturing BG screen (id={screen_id})")
+            if self._monitors is None:
+                self.refresh_monitors()
+            monitors = self._monitors
+            crop = None
+
+            if self._dmd_screen_id is not None:
+                screen_id = self._dmd_screen_id
+                crop = self._dmd_crop
+                logger.info("Capturing DMD screen (id=%s)", screen_id)
+            elif self._bg_screen_id is not None:
+                screen_id = self._bg_screen_id
+                logger.info("Capturing BG screen (id=%s)", screen_id)
             else:
-                _log("INFO", "Capturing primary screen")
-                return ImageGrab.grab()
+                logger.info("Capturing primary screen")
+                return self._grab()
 
             # Capture specific monitor
-            if screen_id is not None and screen_id < len(monitors):
+            if screen_id < len(monitors):
                 mon = monitors[screen_id]
-                bbox = (mon.x, mon.y, mon.x + mon.width, mon.y + mon.height)
-                _log("INFO", f"Screenshot bbox: {bbox}")
-                return ImageGrab.grab(bbox=bbox)
+                if crop:
+                    x, y, w, h = crop
+                    region = (mon.x + x, mon.y + y, w, h)
+                else:
+                    region = (mon.x, mon.y, mon.width, mon.height)
+                logger.info("Screenshot region: %s", region)
+                return self._grab(region)
 
             # Fallback to primary
-            return ImageGrab.grab()
+            return self._grab()
 
         except Exception as e:
-            _log("ERROR", f"Screenshot capture failed: {e}")
+            logger.error("Screenshot capture failed: %s", e)
             return None
 
     def get_last_score(self):
@@ -7,20 +7,32 @@ import json
 import time
 import webview
 import subprocess
+import collections
 from common.tableparser import TableParser
 from common.vpxcollections import VPXCollections
 from common.tablelistfilters import TableListFilters
 from platformdirs import user_config_dir
 
+# One entry of the shared webview_windows list
+WVWin = collections.namedtuple('WVWin', 'name window api')
+
+# Seconds the splash page waits for background theme installation (see main.py)
+THEME_INIT_TIMEOUT = 60
+
 class API:
     
-    def __init__(self, iniConfig):
-        self.webview_windows = None
+    def __init__(self, iniConfig, webview_windows=None, allTables=None, themes_ready=None):
+        self.webview_windows = webview_windows if webview_windows is not None else []
         self.iniConfig = iniConfig
-        self.allTables = TableParser(self.iniConfig.config['Settings']['tablerootdir'], self.iniConfig).getAllTables()
+        if allTables is None:
+            allTables = TableParser(self.iniConfig.config['Settings']['tablerootdir'], self.iniConfig).getAllTables()
+        # Own list: apply_sort() sorts in place and other windows keep their order
+        self.allTables = list(allTables)
         self.filteredTables = self.allTables
         self.myWindow = [] # this holds this instances webview window.  In array because of introspection of the window object
         self.jsTableDictData = None
+        # Set by main.py while default themes are still being installed in the background
+        self.themes_ready = themes_ready
         # Track current filter state
         self.current_filters = {
             'letter': None,
@@ -45,6 +57,12 @@ class API:
     ## Private Functions
     ####################
     
+    def attach_window(self, name, window):
+        """Bind the webview window created for this API and register it as name in webview_windows."""
+        self.myWindow.append(window)
+        self.webview_windows.append(WVWin(name, window, self))
+        self._finish_setup()
+
     def _finish_setup(self): # incase we need to do anything after the windows are created and instanc evars are loaded.
         pass
     
@@ -550,6 +568,9 @@ class API:
         return int(self.iniConfig.config['Network'].get('themeassetsport', '8000'))
 
     def get_theme_index_page(self):
+        # Don't hand out the theme page while it may still be downloading/extracting
+        if self.themes_ready is not None and not self.themes_ready.wait(THEME_INIT_TIMEOUT):
+            print("[WARN] Theme initialization still running, loading theme anyway")
         theme_name = self.get_theme_name()
         port = self.get_theme_assets_port()
         window_name = self.get_my_window_name()
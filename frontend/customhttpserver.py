@@ -1,36 +1,81 @@
 # custom_http_server.py
 import http.server
-from socketserver import ThreadingTCPServer
 import threading
 import os
 import mimetypes
 from urllib.parse import unquote
 from functools import partial
+from collections import OrderedDict
 import posixpath
+import io
+
+# Zero-copy socket writes where the OS has them (not on Windows, where
+# socket.sendfile degrades to 8 KiB send() calls)
+HAS_SENDFILE = hasattr(os, 'sendfile')
+
+# Files up to this size are kept in memory once served (icons, CSS, JS, thumbnails)
+SMALL_FILE_MAX = 256 * 1024
+SMALL_FILE_CACHE_SIZE = 128  # entries, so at most 32 MB
+
+# (path, mtime_ns, size) -> bytes, least recently served first; shared by handler threads
+_small_file_cache = OrderedDict()
+_small_file_lock = threading.Lock()
+
+
+def _cached_small_file(f, st):
+    """
+    Return the contents of the open small file f, from the cache when possible.
+
+    The data is read from f itself, the descriptor the response headers were
+    built from, so a file replaced on disk mid-request can't produce a body
+    that disagrees with Content-Length or get cached under the old key.
+    """
+    key = (f.name, st.st_mtime_ns, st.st_size)
+    with _small_file_lock:
+        data = _small_file_cache.get(key)
+        if data is not None:
+            _small_file_cache.move_to_end(key)
+            return data
+    data = f.read()
+    if len(data) != st.st_size:
+        return data  # changed in place while reading; serve it but don't cache
+    with _small_file_lock:
+        _small_file_cache[key] = data
+        _small_file_cache.move_to_end(key)
+        while len(_small_file_cache) > SMALL_FILE_CACHE_SIZE:
+            _small_file_cache.popitem(last=False)
+    return data
+
 
 class CustomHTTPServer:
     class MultiDirHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         # Set debug True to print verbose logs
         debug = False
 
-        def __init__(self, *args, mount_points=None, **kwargs):
+        def __init__(self, *args, mount_points=None, cache_control=None, **kwargs):
             # normalize mount_points: ensure prefixes start+end with '/'
             mp = mount_points or {}
             normalized = {}
             for p, r in mp.items():
-                prefix = p
-                if not prefix.startswith('/'):
-                    prefix = '/' + prefix
-                if not prefix.endswith('/'):
-                    prefix = prefix + '/'
-                normalized[prefix] = os.path.abspath(r)
+                normalized[self._normalize_prefix(p)] = os.path.abspath(r)
             self.mount_points = normalized
+            # prefix -> Cache-Control value for successful responses under it
+            self.cache_control = {self._normalize_prefix(p): v for p, v in (cache_control or {}).items()}
+            self._cacheable = False
             if self.debug:
                 print("[HTTP] Mount points:")
                 for k, v in self.mount_points.items():
                     print(f"  {k} -> {v}")
             super().__init__(*args, **kwargs)
 
+        @staticmethod
+        def _normalize_prefix(prefix):
+            if not prefix.startswith('/'):
+                prefix = '/' + prefix
+            if not prefix.endswith('/'):
+                prefix = prefix + '/'
+            return prefix
+
         def log_debug(self, *args):
             if self.debug:
                 print("[HTTP]", *args)
@@ -91,11 +136,28 @@ class CustomHTTPServer:
             self.log_debug("No matching mount point for", path)
             return super().translate_path(path)
 
+        def send_response(self, code, message=None):
+            # Errors must not be cached: a missing image may be downloaded later
+            self._cacheable = code in (200, 206, 304)
+            super().send_response(code, message)
+
+        def _cache_header(self):
+            """Cache-Control value for the current request, or None."""
+            if not self._cacheable or not self.cache_control:
+                return None
+            path = unquote(self.path.split('?', 1)[0].split('#', 1)[0])
+            # Pages are always revalidated (Last-Modified makes that a cheap 304)
+            if path.endswith('/') or path.endswith(('.html', '.htm')):
+                return 'no-cache'
+            for prefix, value in sorted(self.cache_control.items(), key=lambda x: -len(x[0])):
+                if path.startswith(prefix):
+                    return value
+            return None
+
         def end_headers(self):
-            # cache busting
-            #self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-            #self.send_header('Pragma', 'no-cache')
-            #self.send_header('Expires', '0')
+            cache_control = self._cache_header()
+            if cache_control:
+                self.send_header('Cache-Control', cache_control)
             # Always add CORS headers to every response
             self.send_header("Access-Control-Allow-Origin", "*")
             self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
@@ -104,6 +166,27 @@ class CustomHTTPServer:
             self.send_header("Access-Control-Expose-Headers", "Content-Length, Content-Range")
             super().end_headers()
 
+        def send_head(self):
+            f = super().send_head()
+            # Swap small regular files for an in-memory copy (directory listings are already BytesIO)
+            if f is not None and not isinstance(f, io.BytesIO):
+                st = os.fstat(f.fileno())
+                if st.st_size <= SMALL_FILE_MAX:
+                    try:
+                        data = _cached_small_file(f, st)
+                    finally:
+                        f.close()
+                    return io.BytesIO(data)
+            return f
+
+        def copyfile(self, source, outputfile):
+            # Files still on disk (too big for the cache) go out via sendfile(2)
+            if not HAS_SENDFILE or isinstance(source, io.BytesIO):
+                super().copyfile(source, outputfile)
+                return
+            outputfile.flush()
+            self.connection.sendfile(source)
+
         def do_GET(self):
             """Override to handle Range requests for video streaming."""
             range_header = self.headers.get('Range')
@@ -148,6 +231,10 @@ class CustomHTTPServer:
 
             try:
                 with open(path, 'rb') as f:
+                    if HAS_SENDFILE:
+                        self.wfile.flush()
+                        self.connection.sendfile(f, offset=start, count=content_length)
+                        return
                     f.seek(start)
                     remaining = content_length
                     while remaining > 0:
@@ -172,14 +259,17 @@ class CustomHTTPServer:
             if self.debug:
                 print("[HTTP] " + fmt % args)
 
-    def __init__(self, mount_points):
+    def __init__(self, mount_points, cache_control=None):
         self.file_server = None
         self.mount_points = mount_points
+        self.cache_control = cache_control
 
     def start_file_server(self, port=8000):
-        handler_class = partial(self.MultiDirHTTPRequestHandler, mount_points=self.mount_points)
-        ThreadingTCPServer.allow_reuse_address = True
-        self.file_server = ThreadingTCPServer(("", port), handler_class)
+        handler_class = partial(self.MultiDirHTTPRequestHandler, mount_points=self.mount_points,
+                                cache_control=self.cache_control)
+        # One thread per request; daemon threads so a stalled client can't hold up exit.
+        # HTTPServer already sets allow_reuse_address.
+        self.file_server = http.server.ThreadingHTTPServer(("", port), handler_class)
         threading.Thread(target=self.file_server.serve_forever, daemon=True).start()
         print(f"[INFO] Serving on http://127.0.0.1:{port}/")
 
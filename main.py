@@ -10,24 +10,20 @@ from common.iniconfig import IniConfig
 from common.scoretracker import ScoreTracker
 import sys
 import os
+import json
+import logging
+from functools import lru_cache
 from clioptions import parseArgs
 from managerui.managerui import start_manager_ui, stop_manager_ui
 from nicegui import app as nicegui_app
 from platformdirs import user_config_dir
 from common.themes import ThemeRegistry
 
-#debug
-import sys
-from common.vpxcollections import VPXCollections
-from common.tableparser import TableParser
-
 # Get the base path
-base_path = os.path.dirname(os.path.abspath(__file__))
+BASE = Path(__file__).resolve().parent
 
-nicegui_app.add_static_files('/static', os.path.join(base_path, 'managerui/static'))
-html_file = Path(base_path) / "web/splash.html"
-notification_file = Path(base_path) / "web/notification.html"
-webview_windows = [] # [ [window_name, window, api] ]
+nicegui_app.add_static_files('/static', str(BASE / 'managerui' / 'static'))
+webview_windows = [] # [ WVWin(window_name, window, api) ], filled by API.attach_window
 
 # Use platform-specific config directory
 config_dir = Path(user_config_dir("vpinfe", "vpinfe"))
@@ -36,13 +32,45 @@ config_path = config_dir / "vpinfe.ini"
 iniconfig = IniConfig(str(config_path))
 
  # The last window created will be the one in focus.  AKA the controller for all the other windows!!!! Always "table"
-import sys
-import webview
+
+# (ini key in [Displays], window title, window name) in creation order; table stays last
+SCREENS = [
+    ('bgscreenid', "BG Screen", 'bg'),
+    ('dmdscreenid', "DMD Screen", 'dmd'),
+    ('tablescreenid', "Table Screen", 'table'),
+]
+
+@lru_cache(maxsize=1)
+def _get_monitors():
+    """Monitor layout, queried once; the windows are placed on it at startup and stay there."""
+    return get_monitors()
+
+def _make_window(title, tag, mon, window_flags, tables=None):
+    """Create one fullscreen frontend window on mon and register it in webview_windows."""
+    # Each window needs its own API; it identifies its window through myWindow.
+    # The parsed table list is shared so the table dir is only scanned once.
+    api = API(iniconfig, webview_windows, tables, themes_ready)
+
+    win = webview.create_window(
+        title,
+        url=HTML_URL,
+        js_api=api,
+        x=mon.x,
+        y=mon.y,
+        width=mon.width,
+        height=mon.height,
+        background_color="#000000",
+        fullscreen=window_flags["fullscreen"],
+        frameless=window_flags["frameless"],  # also forces a frameless table on mac
+        resizable=window_flags["resizable"],
+    )
+
+    api.attach_window(tag, win)
+    return api
 
 def loadWindows():
-    global webview_windows
     global api
-    monitors = get_monitors()
+    monitors = _get_monitors()
     print(monitors)
 
     is_mac = sys.platform == "darwin"
@@ -54,135 +82,99 @@ def loadWindows():
         "resizable": False if is_mac else True,
     }
 
-    # --- BG SCREEN ---
-    if iniconfig.config['Displays']['bgscreenid']:
-        screen_id = int(iniconfig.config['Displays']['bgscreenid'])
-        api = API(iniconfig)
-
-        win = webview.create_window(
-            "BG Screen",
-            url=f"file://{html_file.resolve()}",
-            js_api=api,
-            x=monitors[screen_id].x,
-            y=monitors[screen_id].y,
-            width=monitors[screen_id].width,
-            height=monitors[screen_id].height,
-            background_color="#000000",
-            fullscreen=window_flags["fullscreen"],
-            frameless=window_flags["frameless"],
-            resizable=window_flags["resizable"],
-        )
-
-        api.myWindow.append(win)
-        webview_windows.append(['bg', win, api])
-        api.webview_windows = webview_windows
-        api.iniConfig = iniconfig
-        api._finish_setup()
-
-    # --- DMD SCREEN ---
-    if iniconfig.config['Displays']['dmdscreenid']:
-        screen_id = int(iniconfig.config['Displays']['dmdscreenid'])
-        api = API(iniconfig)
-
-        win = webview.create_window(
-            "DMD Screen",
-            url=f"file://{html_file.resolve()}",
-            js_api=api,
-            x=monitors[screen_id].x,
-            y=monitors[screen_id].y,
-            width=monitors[screen_id].width,
-            height=monitors[screen_id].height,
-            background_color="#000000",
-            fullscreen=window_flags["fullscreen"],
-            frameless=window_flags["frameless"],
-            resizable=window_flags["resizable"],
-        )
-
-        api.myWindow.append(win)
-        webview_windows.append(['dmd', win, api])
-        api.webview_windows = webview_windows
-        api.iniConfig = iniconfig
-        api._finish_setup()
-
-    # --- TABLE SCREEN (ALWAYS LAST) ---
-    if iniconfig.config['Displays']['tablescreenid']:
-        screen_id = int(iniconfig.config['Displays']['tablescreenid'])
-        api = API(iniconfig)
-
-        win = webview.create_window(
-            "Table Screen",
-            url=f"file://{html_file.resolve()}",
-            js_api=api,
-            x=monitors[screen_id].x,
-            y=monitors[screen_id].y,
-            width=monitors[screen_id].width,
-            height=monitors[screen_id].height,
-            background_color="#000000",
-            fullscreen=window_flags["fullscreen"],
-            frameless=True if is_mac else False,  # force frameless for table on mac
-            resizable=window_flags["resizable"],
-        )
-
-        api.myWindow.append(win)
-        webview_windows.append(['table', win, api])
-        api.webview_windows = webview_windows
-        api.iniConfig = iniconfig
-        api._finish_setup()
-
+    displays = iniconfig.config['Displays']
+    tables = None  # parsed by the first window, reused by the rest
+    for key, title, tag in SCREENS:
+        screen_id = displays.get(key)
+        if screen_id:
+            api = _make_window(title, tag, monitors[int(screen_id)], window_flags, tables)
+            tables = api.allTables
 
 
 if len(sys.argv) > 0:
     parseArgs()
 
-# Initialize theme registry and auto-install default themes
-try:
-    theme_registry = ThemeRegistry()
-    theme_registry.load_registry()
-    theme_registry.load_theme_manifests()
-    theme_registry.auto_install_defaults()
-except Exception as e:
-    print(f"[WARN] Theme registry initialization failed: {e}")
+# Initialize theme registry and auto-install default themes.  This fetches from
+# GitHub, so it runs alongside window creation; get_theme_index_page waits on it.
+themes_ready = threading.Event()
 
-# Initialize webview windows
-loadWindows()
-
-# Start an the HTTP server to serve the images from the "tables" directory
+def _init_themes():
+    global theme_registry
+    try:
+        theme_registry = ThemeRegistry()
+        theme_registry.load_registry()
+        theme_registry.load_theme_manifests()
+        theme_registry.auto_install_defaults()
+    except Exception as e:
+        print(f"[WARN] Theme registry initialization failed: {e}")
+    finally:
+        themes_ready.set()
+
+threading.Thread(target=_init_themes, daemon=True).start()
+
+# Start an the HTTP server to serve the images from the "tables" directory.
+# It must be up before loadWindows(), since the windows load their pages from it.
 themes_dir = str(config_dir / "themes")
 os.makedirs(themes_dir, exist_ok=True)
 nicegui_app.add_static_files('/themes', themes_dir)
 
 MOUNT_POINTS = {
-        '/tables/': os.path.abspath(iniconfig.config['Settings']['tablerootdir']),
-        '/web/': os.path.join(base_path, 'web'),
+        '/tables/': str(Path(iniconfig.config['Settings']['tablerootdir']).resolve()),
+        '/web/': str(BASE / 'web'),
         '/themes/': themes_dir,
         }
-http_server = CustomHTTPServer(MOUNT_POINTS)
+# pywebview runs in private mode, so this cache only lives for one VPinFE session.
+# Table media can be replaced from the manager UI and is always revalidated.
+CACHE_CONTROL = {
+        '/tables/': 'no-cache',
+        '/web/': 'public, max-age=604800, stale-while-revalidate=86400, immutable',
+        '/themes/': 'public, max-age=604800, stale-while-revalidate=86400, immutable',
+        }
+http_server = CustomHTTPServer(MOUNT_POINTS, CACHE_CONTROL)
 theme_assets_port = int(iniconfig.config['Network'].get('themeassetsport', '8000'))
 http_server.start_file_server(port=theme_assets_port)
 
+# Splash and notification pages come from the /web/ mount so they share the
+# HTTP cache (one read of splash.html and its assets for all three windows)
+HTML_URL = f"http://127.0.0.1:{theme_assets_port}/web/splash.html"
+NOTIFICATION_URL = f"http://127.0.0.1:{theme_assets_port}/web/notification.html"
+
+# Initialize webview windows
+loadWindows()
+
 # Start the NiceGUI HTTP server
 manager_ui_port = int(iniconfig.config['Network'].get('manageruiport', '8001'))
 start_manager_ui(port=manager_ui_port)
 
+# Notification log lines; routine steps are DEBUG, so they cost nothing at the default [Logger] level
+notify_log = logging.getLogger("notification")
+_notify_handler = logging.StreamHandler(sys.stdout)
+_notify_handler.setFormatter(logging.Formatter("[NOTIFICATION] %(message)s"))
+notify_log.addHandler(_notify_handler)
+notify_log.propagate = False
+_log_level = logging.getLevelName(iniconfig.config['Logger'].get('level', 'info').strip().upper())
+notify_log.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)
+
+# Toast call run in the notification overlay (see web/notification.html)
+NOTIFY_JS = 'showNotification({title}, {message})'
+
 # Notification function — creates a temporary overlay on the configured monitor
 def trigger_notification(title, message):
     """Create a temporary overlay window on the configured monitor, show the toast, then destroy it."""
-    import threading
-
     screen_id_str = iniconfig.config['Leaderboard'].get('notificationscreenid', '0')
     if not screen_id_str:
-        print("[NOTIFICATION] notificationscreenid is empty, skipping notification")
+        notify_log.debug("notificationscreenid is empty, skipping notification")
         return
 
     try:
         screen_id = int(screen_id_str)
     except ValueError:
-        print(f"[NOTIFICATION] Invalid notificationscreenid: {screen_id_str}")
+        notify_log.warning("Invalid notificationscreenid: %s", screen_id_str)
         return
 
-    monitors = get_monitors()
+    monitors = _get_monitors()
     if screen_id >= len(monitors):
-        print(f"[NOTIFICATION] Monitor {screen_id} not found (only {len(monitors)} available)")
+        notify_log.warning("Monitor %s not found (only %s available)", screen_id, len(monitors))
         return
 
     mon = monitors[screen_id]
@@ -193,16 +185,13 @@ def trigger_notification(title, message):
     win_x = int(mon.x + mon.width - win_width - 20)
     win_y = int(mon.y + 20)
 
-    safe_title = title.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
-    safe_message = str(message).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
-
-    print(f"[NOTIFICATION] Creating overlay on monitor {screen_id} at {win_x},{win_y}")
+    notify_log.debug("Creating overlay on monitor %s at %s,%s", screen_id, win_x, win_y)
 
     def _show_and_destroy():
         try:
             overlay = webview.create_window(
                 "Notification",
-                url=f"file://{notification_file.resolve()}",
+                url=NOTIFICATION_URL,
                 transparent=True,
                 frameless=True,
                 on_top=True,
@@ -213,20 +202,24 @@ def trigger_notification(title, message):
                 focus=False,
             )
 
-            # Wait for the window's DOM to be ready, then fire the notification
+            # json.dumps yields quoted JS string literals (ASCII-only, so U+2028 etc. are escaped too)
+            notify_js = NOTIFY_JS.format(title=json.dumps(str(title)), message=json.dumps(str(message)))
+
+            # Fire the notification as soon as the window's DOM is ready
             import time
-            time.sleep(0.5)
+            if not overlay.events.loaded.wait(5):
+                notify_log.warning("Overlay did not finish loading, showing anyway")
 
-            overlay.evaluate_js(f'showNotification("{safe_title}", "{safe_message}")')
-            print(f"[NOTIFICATION] Toast shown: {title}")
+            overlay.evaluate_js(notify_js)
+            notify_log.debug("Toast shown: %s", title)
 
             # 5s toast + 0.4s fade-out + small buffer
             time.sleep(6)
 
             overlay.destroy()
-            print("[NOTIFICATION] Overlay destroyed")
+            notify_log.debug("Overlay destroyed")
         except Exception as e:
-            print(f"[NOTIFICATION] Error: {e}")
+            notify_log.error("Error: %s", e)
 
     # Run on a background thread so we don't block the caller (score tracker)
     threading.Thread(target=_show_and_destroy, daemon=True).start()
@@ -257,5 +250,5 @@ if restart_flag.exists():
     restart_flag.unlink()
     print("[VPinFE] Restart requested, re-launching...")
     python_exe = sys.executable
-    main_script = os.path.abspath(__file__)
-    os.execvp(python_exe, [python_exe, main_script])
+    main_script = str(Path(__file__).resolve())
+    os.execv(python_exe, [python_exe, main_script])